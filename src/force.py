@@ -28,12 +28,52 @@ For example: grouping all the pumps together. The component set is created to pr
 
 import os
 import json
-from collections import OrderedDict
+import hashlib
+import pickle
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from scipy.optimize import curve_fit
 import matplotlib as mpl
+# the plots are only saved to PNG files, so the non-interactive backend is used
+# (it is also required for the worker processes of extract_all_force_componentsets)
+mpl.use('Agg')
 import matplotlib.pyplot as plt
 
+# The folder of the on-disk cache of parsed JSON files used by load_json_cached
+_json_cache_folder = os.path.join(os.path.expanduser("~"), ".cache", "force")
+
+def load_json_cached(json_path):
+  """
+    Loading a JSON file through an on-disk pickle cache keyed by the file's path, size and
+    modification time, so repeated runs skip re-parsing files that did not change
+    @ In, json_path, str, The path of the JSON file
+    @ Out, loaded_dict, dict, The parsed content of the JSON file
+  """
+  file_stat = os.stat(json_path)
+  file_signature = (file_stat.st_mtime_ns, file_stat.st_size)
+  # one cache entry per source path, so writing a replacement also evicts the stale one
+  cache_file = os.path.join(_json_cache_folder, hashlib.sha1(os.path.abspath(json_path).encode()).hexdigest() + ".pkl")
+  try:
+    with open(cache_file, 'rb') as cache_fh:
+      cached_signature, loaded_dict = pickle.load(cache_fh)
+    if cached_signature == file_signature:
+      return loaded_dict
+  except (OSError, pickle.PickleError, EOFError, ValueError, TypeError):
+    # a missing, truncated or otherwise unreadable entry is just a cache miss
+    pass
+  with open(json_path) as json_fh:
+    loaded_dict = json.loads(json_fh.read())
+  os.makedirs(_json_cache_folder, exist_ok=True)
+  # writing to a per-process temporary file and renaming keeps the entry whole even if
+  # a run crashes mid-write or several processes refresh the same entry at once
+  temporary_file = f"{cache_file}.{os.getpid()}.tmp"
+  with open(temporary_file, 'wb') as cache_fh:
+    pickle.dump((file_signature, loaded_dict), cache_fh)
+  os.replace(temporary_file, cache_file)
+  return loaded_dict
+
+
 # Section 1:
 # Python Classes for the APEA Component, HYSYS Component, FORCE component, and FORCE ComponentSet
 
@@ -61,11 +101,10 @@ class ForceComponent:
     """
     dict_list=[]
     for code_file in self.codes_files:
-      dict1 = json.load(open(code_file))
-      dict_list.append(dict1)
+      dict_list.append(load_json_cached(code_file))
     force_dict = {}
-    for dict in dict_list:
-      force_dict.update(dict)
+    for code_dict in dict_list:
+      force_dict.update(code_dict)
     search_key = 'Component Name'
     available_components_names =[]
     redundant_keys = []
@@ -77,13 +116,13 @@ class ForceComponent:
       print("Error: The components' names are not similar")
     else:
       force_component_name =   available_components_names[1]
-    force_dict['Component Name'] = force_component_name
 
-    for key in redundant_keys:
-      del force_dict[key]
-    force_dict=OrderedDict(force_dict)
-    force_dict.move_to_end('Component Name', last=False)
-    return(force_dict)
+    # plain dicts preserve insertion order, so inserting the name first keeps it first
+    ordered_force_dict = {'Component Name': force_component_name}
+    for key, value in force_dict.items():
+      if key not in redundant_keys:
+        ordered_force_dict[key] = value
+    return(ordered_force_dict)
 
 
 class ForceComponentSet:
@@ -97,16 +136,23 @@ class ForceComponentSet:
     6- The cost function equation coefficient X: The scaling factor
   """
   
-  def __init__(self, component_sets_file, component_dicts_list):
+  def __init__(self, component_sets_file, component_dicts_list, components_by_category=None, components_by_name=None):
     """
     Constructor
     @ In, component_sets_file, str,
     The file that is is edited by the used to idnetify the sets of components that need to be grouped together
     @ In, list of dictionaries of the FORCE components, list.
+    @ In, components_by_category, dict, optional, the FORCE components indexed by HYSYS category (built here if not provided)
+    @ In, components_by_name, dict, optional, the FORCE components indexed by component name (built here if not provided)
     @ Out, None
     """
     self.component_sets_file = component_sets_file
     self.component_dicts_list = component_dicts_list
+    self.component_sets_file_dict = load_json_cached(component_sets_file)
+    if components_by_category is None or components_by_name is None:
+      components_by_category, components_by_name = index_force_components(component_dicts_list)
+    self.components_by_category = components_by_category
+    self.components_by_name = components_by_name
 
    
   def component_set_info(self):
@@ -116,109 +162,87 @@ class ForceComponentSet:
     @ Out, comp_set_info_dict,  dict, A dictionay of the component set information
     """
 
-    available_components, available_component_types = [], []
-
-    for comp in self.component_dicts_list:
-      if comp.get('HYSYS'):
-        component_name = comp.get('Component Name')      
-        component_type=(comp.get('HYSYS')).get('Category')
-        available_components.append(component_name)
-        available_component_types.append(component_type)
+    components_by_category, components_by_name = self.components_by_category, self.components_by_name
     all_included_components, all_included_powers, all_included_power_units, all_included_installed_costs=[], [], [], []
 
-    component_sets_file_dict = json.load(open(self.component_sets_file))
+    component_sets_file_dict = self.component_sets_file_dict
     set_name = component_sets_file_dict.get("Set Name")
-    
+
     if "Included Categories" in component_sets_file_dict:
       included_types = (component_sets_file_dict.get("Included Categories"))
-      for type in included_types:
-        if type not in available_component_types:
-          print(f"The components category '{type}' does not exist")
-        elif type in available_component_types: 
-          
-          for comp in self.component_dicts_list:
-            if comp.get('HYSYS'):
-              component_type=(comp.get('HYSYS')).get('Category')
-              if component_type == type:
-                included_comp =comp.get('Component Name')  
-                all_included_components.append(included_comp)
-                included_power = (comp.get('HYSYS')).get('Power')
-                all_included_powers.append(included_power)
-                included_power_unit = (comp.get('HYSYS')).get('Power Units')
-                all_included_power_units.append(included_power_unit)
-                included_installed_cost_USD = (comp.get('APEA')).get('Installed Cost [USD]')
-                all_included_installed_costs.append(included_installed_cost_USD)
+      for included_type in included_types:
+        if included_type not in components_by_category:
+          print(f"The components category '{included_type}' does not exist")
+        else:
+          for comp in components_by_category[included_type]:
+            included_comp =comp.get('Component Name')
+            all_included_components.append(included_comp)
+            included_power = (comp.get('HYSYS')).get('Power')
+            all_included_powers.append(included_power)
+            included_power_unit = (comp.get('HYSYS')).get('Power Units')
+            all_included_power_units.append(included_power_unit)
+            included_installed_cost_USD = (comp.get('APEA')).get('Installed Cost [USD]')
+            all_included_installed_costs.append(included_installed_cost_USD)
 
 
     if "Included Components" in component_sets_file_dict:
       included_names = (component_sets_file_dict.get("Included Components"))
       for comp_name in included_names:
-        if comp_name not in available_components:
+        if comp_name not in components_by_name:
           print(f"The component named '{comp_name}' does not exist")
         else:
+          comp = components_by_name[comp_name]
           all_included_components.append(comp_name)
-          
-          for comp in self.component_dicts_list:
-            if comp.get('HYSYS'):
-              component_name= comp.get('Component Name') 
-              if component_name == comp_name:
-                included_power = (comp.get('HYSYS')).get('Power')
-                all_included_powers.append(included_power)
-                included_power_unit = (comp.get('HYSYS')).get('Power Units')
-                all_included_power_units.append(included_power_unit)
-                included_installed_cost_USD = (comp.get('APEA')).get('Installed Cost [USD]')
-                all_included_installed_costs.append(included_installed_cost_USD)
+          included_power = (comp.get('HYSYS')).get('Power')
+          all_included_powers.append(included_power)
+          included_power_unit = (comp.get('HYSYS')).get('Power Units')
+          all_included_power_units.append(included_power_unit)
+          included_installed_cost_USD = (comp.get('APEA')).get('Installed Cost [USD]')
+          all_included_installed_costs.append(included_installed_cost_USD)
 
     # # Excluding components with unknown information or non reasonable info
-    excluded_components_indices = []
-    for i in range(len(all_included_components)):
-      if float(all_included_powers[i])<=0 or all_included_powers[i] =="unknown":
-        print('\033[91m', "\n", f"The component(s) '{all_included_components[i]}' will be excluded because of unknown or non-positive power value",  '\033[0m')
-        excluded_components_indices.append(i)
-      if all_included_power_units[i] not in ['kW', 'MW']:
-        print('\033[91m', "\n", f"The component(s) '{all_included_components[i]}' will be excluded because of unknown power unit", '\033[0m')
-        excluded_components_indices.append(i)
-      if all_included_installed_costs[i]<=0:
-            print('\033[91m', "\n", f"The component '{all_included_components[i]}' will be excluded because of non-positive cost", '\033[0m')
-            excluded_components_indices.append(i)
-
-
-    updated_components_set, updated_powers, updated_power_units, updated_costs=[], [], [], []
-    for i in range(len(all_included_components)):
-      if i not in excluded_components_indices:
-        updated_components_set.append(all_included_components[i])
-        updated_powers.append(all_included_powers[i])
-        updated_power_units.append(all_included_power_units[i])
-        updated_costs.append(all_included_installed_costs[i])
+    # an "unknown" power becomes NaN so it is excluded instead of crashing the float conversion
+    all_powers_arr = np.array([float(power) if power != "unknown" else np.nan for power in all_included_powers])
+    all_units_arr = np.asarray(all_included_power_units)
+    all_costs_arr = np.asarray(all_included_installed_costs, dtype=np.float64)
+    bad_power = ~np.isfinite(all_powers_arr) | (all_powers_arr <= 0)
+    bad_unit = ~np.isin(all_units_arr, ('kW', 'MW'))
+    bad_cost = all_costs_arr <= 0
+    for i in np.where(bad_power)[0]:
+      print('\033[91m', "\n", f"The component(s) '{all_included_components[i]}' will be excluded because of unknown or non-positive power value",  '\033[0m')
+    for i in np.where(bad_unit)[0]:
+      print('\033[91m', "\n", f"The component(s) '{all_included_components[i]}' will be excluded because of unknown power unit", '\033[0m')
+    for i in np.where(bad_cost)[0]:
+      print('\033[91m', "\n", f"The component '{all_included_components[i]}' will be excluded because of non-positive cost", '\033[0m')
+
+    keep = ~(bad_power | bad_unit | bad_cost)
+    updated_components_set = [comp for comp, kept in zip(all_included_components, keep) if kept]
+    updated_powers = all_powers_arr[keep]
+    updated_power_units = all_units_arr[keep]
+    updated_costs = all_costs_arr[keep]
 
     # To ensure that the power units are the same
-    common_unit=(max(set(updated_power_units), key=updated_power_units.count))
-    updated_powers_same_unit=[0]*len(updated_powers)
-    for i in range(len(updated_power_units)):
-      if updated_power_units[i] !=common_unit:
-        if common_unit == "kW":
-          updated_powers_same_unit[i] = 1000*updated_powers[i]
-        if common_unit == "MW":
-          updated_powers_same_unit[i] = 0.001*updated_powers[i]
-      else:
-        updated_powers_same_unit[i] = updated_powers[i]
-
-    reference_driver = max(updated_powers_same_unit)
+    common_unit = Counter(updated_power_units).most_common(1)[0][0]
+    # the only possible units are kW and MW so the conversion factor is fixed by the common unit
+    unit_scale = 1000.0 if common_unit == "kW" else 0.001
+    updated_powers_same_unit = np.where(updated_power_units == common_unit, updated_powers, unit_scale*updated_powers)
 
-    # (D/D') in the cost function
-    capacity_ratio = []
-    for p in updated_powers_same_unit:
-        capacity_ratio.append(p/reference_driver )
+    reference_driver = float(np.max(updated_powers_same_unit))
 
+    # (D/D') in the cost function
+    capacity_ratio = updated_powers_same_unit/reference_driver
 
     # # Curve fitting
-    updated_costs_output = updated_costs
-    popt, _  = curve_fit(lambda t, a, b: a * (t ** b), capacity_ratio, updated_costs_output)
+    # the power law c = a*(t**b) is log-linear (log c = log a + b*log t), so a linear
+    # least-squares fit in log space gives curve_fit a cheap starting point that speeds
+    # up convergence without changing the linear-space optimum
+    slope, intercept = np.polyfit(np.log(capacity_ratio), np.log(updated_costs), 1)
+    popt, _  = curve_fit(lambda t, a, b: a * (t ** b), capacity_ratio, updated_costs, p0=(np.exp(intercept), slope))
     ref_price = popt[0]
     scaling_factor = popt[1]
     calculated_costs = ref_price*(capacity_ratio**scaling_factor)
-    error = (100*(abs(updated_costs-calculated_costs) )/updated_costs)
-    avg_error = round(sum(error)/len(error), 2)
+    error = (100*(np.abs(updated_costs-calculated_costs) )/updated_costs)
+    avg_error = round(float(error.mean()), 2)
 
     # The created dictionary of the component set
     comp_set_info_dict = {
@@ -232,14 +256,14 @@ class ForceComponentSet:
                           "Fitting Average Error (%)": avg_error }
 
     # Plotting
-    plt.figure()
-    ax = plt.axes()
+    fig, ax = plt.subplots()
     ax.scatter(updated_powers_same_unit, updated_costs, label='APEA Cost')
     ax.yaxis.set_major_formatter(mpl.ticker.StrMethodFormatter('{x:,.0f}'))
     ax.xaxis.set_major_formatter(mpl.ticker.StrMethodFormatter('{x:,.1f}'))
     ax.grid()
-    power_fitted = np.linspace(np.min(updated_powers_same_unit), np.max(updated_powers_same_unit), 100)
-    capacity_ratio_fitted = np.linspace(np.min(capacity_ratio), np.max(capacity_ratio), 100)
+    power_fitted = np.linspace(updated_powers_same_unit.min(), updated_powers_same_unit.max(), 100)
+    # capacity_ratio is power/reference_driver, so the fitted ratios are just a rescale of the fitted powers
+    capacity_ratio_fitted = power_fitted/reference_driver
     fitted_costs = ref_price*(capacity_ratio_fitted**scaling_factor)
 
     ax.plot(power_fitted, fitted_costs, 'k', label='Fitted Cost')
@@ -250,14 +274,16 @@ class ForceComponentSet:
     ax.set_title(f'Cost function curve of "{set_name}" \n Ref Driver = {reference_driver_rounded} {common_unit} \n Ref price(USD) = {ref_price_rounded} \n Scaling factor = {scaling_factor_rounded} \n MAPE = {avg_error } %', pad=12)
     ax.set_ylabel('Cost [USD]')
     ax.set_xlabel(f'Power in {common_unit}')
-    ax.legend(bbox_to_anchor=(1,1), loc="upper right", bbox_transform=plt.gcf().transFigure)
-    plt.tight_layout()
+    ax.legend(bbox_to_anchor=(1,1), loc="upper right", bbox_transform=fig.transFigure)
+    fig.tight_layout()
 
     output_file = self.component_sets_file.split('txt', 1)[0] + 'png'
-    file_exists = os.path.exists(output_file)
-    if file_exists:
-      os.remove(output_file)
-    plt.savefig(output_file)
+    # writing to a temporary file and renaming keeps the output atomic when sets are processed in parallel
+    temporary_file = output_file + '.tmp'
+    fig.savefig(temporary_file, format='png')
+    os.replace(temporary_file, output_file)
+    # closing the figure so it does not accumulate in the pyplot registry over large runs
+    plt.close(fig)
 
     print('\n', f'The components set "{set_name}" includes the following {len(updated_components_set)} components:','\n', updated_components_set)
     print('\n', f'The cost function of the component set "{set_name}" is produced and stored at: \n {output_file}')
@@ -271,70 +297,110 @@ class ForceComponentSet:
 # Section 2:
 # Python Methods extracing all the FORCE components
 
+def index_force_components(component_dicts_list):
+  """
+    Indexing the FORCE components by HYSYS category and by component name
+    @ In, component_dicts_list, list, list of dictionaries of the FORCE components
+    @ Out, (components_by_category, components_by_name), tuple, dicts of components keyed by HYSYS category and by component name
+  """
+  components_by_category, components_by_name = {}, {}
+  for comp in component_dicts_list:
+    if comp.get('HYSYS'):
+      components_by_category.setdefault((comp.get('HYSYS')).get('Category'), []).append(comp)
+      components_by_name[comp.get('Component Name')] = comp
+  return components_by_category, components_by_name
+
+
 def create_all_force_components_from_hysys_apea(list_of_lists_of_comps_from_multiple_codes, hysys_folder):
   comps_from_multiple_codes_flat_list = [item for sublist in list_of_lists_of_comps_from_multiple_codes for item in sublist]
-  available_comps = []
-  for dict in comps_from_multiple_codes_flat_list:
-    available_comps.append(dict.get("Component ID")) 
-      
-
-  force_dicts_list = []
-  for comp in set(available_comps):
-    same_name_comps = []
-    for dict in comps_from_multiple_codes_flat_list:
-      if dict.get("Component ID") == comp:
-        same_name_comps.append(dict)
-    force_dicts_list.append(same_name_comps)
-
-  # merging dictionaries
-  force_dicts_list_1 = []
-  for list in force_dicts_list:
-    force_dict = {}
-    for d in list:
-      force_dict.update(d)
-    force_dicts_list_1.append(force_dict )
+
+  # grouping and merging the dictionaries that share the same "Component ID" in a single pass
+  # while noting which codes contributed to each component
+  merged_comps = {}
+  has_apea, has_hysys = {}, {}
+  for d in comps_from_multiple_codes_flat_list:
+    comp_id = d.get("Component ID")
+    merged_comps.setdefault(comp_id, {}).update(d)
+    if "APEA_Source" in d:
+      has_apea[comp_id] = True
+    if "HYSYS Source" in d:
+      has_hysys[comp_id] = True
+
   # re-arranging FORCEdictionary
   force_dicts_list_2 = []
-  for dict in force_dicts_list_1:
-    new_force_dict  = {x:dict[x] for x in ["Component Name", "Component ID"]} 
-    new_force_dict['Sources'] = str(dict.get('HYSYS Source')) +"  &  " + str(dict.get('APEA_Source'))
-    
+  for comp_id, merged_dict in merged_comps.items():
+    new_force_dict  = {x:merged_dict[x] for x in ["Component Name", "Component ID"]}
+    new_force_dict['Sources'] = str(merged_dict.get('HYSYS Source')) +"  &  " + str(merged_dict.get('APEA_Source'))
+
     #APEA mini dictionary
-    if any("APEA" in key for key in dict):
+    if has_apea.get(comp_id):
       APEA_dict = {
-        "Equipment Cost [USD]" : dict.get("APEA Equipment Cost [USD]"),
-        "Installed Cost [USD]": dict.get("APEA Installed Cost [USD]"),
-        "Equipment Weight [LBS]" : dict.get("APEA Equipment Weight [LBS]"),
-        "Total Installed Weight [LBS]" : dict.get("APEA Total Installed Weight [LBS]")
+        "Equipment Cost [USD]" : merged_dict.get("APEA Equipment Cost [USD]"),
+        "Installed Cost [USD]": merged_dict.get("APEA Installed Cost [USD]"),
+        "Equipment Weight [LBS]" : merged_dict.get("APEA Equipment Weight [LBS]"),
+        "Total Installed Weight [LBS]" : merged_dict.get("APEA Total Installed Weight [LBS]")
       }
       new_force_dict["APEA"] = APEA_dict
 
     #HYSYS mini dictionary
-    if any("HYSYS" in key for key in dict):
+    if has_hysys.get(comp_id):
       HYSYS_dict = {
-        "Category" : dict.get("HYSYS Category"),
-        "Power": dict.get("HYSYS Power"),
-        "Power Units" : dict.get("HYSYS Power Units")
+        "Category" : merged_dict.get("HYSYS Category"),
+        "Power": merged_dict.get("HYSYS Power"),
+        "Power Units" : merged_dict.get("HYSYS Power Units")
       }
       new_force_dict["HYSYS"] = HYSYS_dict
 
     force_dicts_list_2.append(new_force_dict)
 
-    # dumping FORCE components
-    force_outputs_path = os.path.split(os.path.abspath(hysys_folder))[0]+ "/FORCE_Components/"
-    if not os.path.exists(force_outputs_path):
-      os.makedirs(force_outputs_path)
-    for dict in force_dicts_list_2:
-      output_file = force_outputs_path+str(dict.get("Component ID")).replace(" ", "").replace('/', '_') +".txt"
-      file_exists = os.path.exists(output_file)
-      if file_exists:
-        os.remove(output_file)
-      json.dump(dict, open(output_file, 'w'), indent = 6)
+  # dumping FORCE components
+  force_outputs_path = os.path.split(os.path.abspath(hysys_folder))[0]+ "/FORCE_Components/"
+  os.makedirs(force_outputs_path, exist_ok=True)
+  for force_dict in force_dicts_list_2:
+    output_file = force_outputs_path+str(force_dict.get("Component ID")).replace(" ", "").replace('/', '_') +".txt"
+    with open(output_file, 'w') as output_fh:
+      json.dump(force_dict, output_fh, indent = 6)
   print(f" \n {len(force_dicts_list_2)} FORCE components are created at:\n {force_outputs_path }  \n")
   
   return force_dicts_list_2, force_outputs_path   
 
 
+# The state that each worker process of extract_all_force_componentsets receives
+# once through the pool initializer instead of once per setfile
+_worker_component_dicts_list = None
+_worker_components_by_category = None
+_worker_components_by_name = None
+
+def _init_componentset_worker(component_dicts_list):
+  """
+    Storing the FORCE components (and their indexes) in the worker process
+    @ In, component_dicts_list, list, list of dictionaries of the FORCE components
+    @ Out, None
+  """
+  global _worker_component_dicts_list, _worker_components_by_category, _worker_components_by_name
+  _worker_component_dicts_list = component_dicts_list
+  _worker_components_by_category, _worker_components_by_name = index_force_components(component_dicts_list)
+
+
+def _process_one_setfile(setfile_path):
+  """
+    Creating the component set (cost function plot and output file) of one setfile
+    @ In, setfile_path, str, The path of the user-input setfile
+    @ Out, output_file_path, str, The path of the created component set file
+  """
+  print('\033[1m', f"\n\n A component set is found in '{os.path.basename(setfile_path)}'", '\033[0m')
+  componentSet_dict = ForceComponentSet(setfile_path, _worker_component_dicts_list,
+                                        _worker_components_by_category, _worker_components_by_name).component_set_info()
+
+  output_file_path = setfile_path.replace("Setfile", "componentSet")
+  temporary_file = output_file_path + '.tmp'
+  with open(temporary_file, 'w') as output_fh:
+    json.dump(componentSet_dict, output_fh, indent = 2)
+  os.replace(temporary_file, output_file_path)
+  print(" \n", f"The new component set can be found at {output_file_path}")
+  return output_file_path
+
+
 def extract_all_force_componentsets(component_sets_folder, component_dicts_list):
   """
     Extracting ALL the component sets
@@ -343,15 +409,11 @@ def extract_all_force_componentsets(component_sets_folder, component_dicts_list)
     @ In, list of dictionaries of the FORCE components, list
     @ Out, None
   """
-  for Setfile in os.listdir(component_sets_folder):
-    if Setfile.startswith("Setfile") and Setfile.endswith(".txt"):
-      print('\033[1m', f"\n\n A component set is found in '{Setfile}'", '\033[0m')
-      Setfile_path = component_sets_folder + Setfile
-      componentSet_dict = ForceComponentSet(Setfile_path, component_dicts_list).component_set_info()
-
-      output_file_path = Setfile_path.replace("Setfile", "componentSet")
-      file_exists = os.path.exists(output_file_path)
-      if file_exists:
-        os.remove(output_file_path)
-      json.dump(componentSet_dict, open(output_file_path, 'w'), indent = 2)
-      print(" \n", f"The new component set can be found at {output_file_path}")
\ No newline at end of file
+  with os.scandir(component_sets_folder) as folder_entries:
+    setfiles = [entry.path for entry in folder_entries
+                if entry.is_file() and entry.name.startswith("Setfile") and entry.name.endswith(".txt")]
+
+  # each setfile is independent (own JSON read, curve fit and PNG/JSON writes),
+  # so the sets are processed in parallel worker processes
+  with ProcessPoolExecutor(initializer=_init_componentset_worker, initargs=(component_dicts_list,)) as executor:
+    list(executor.map(_process_one_setfile, setfiles))
\ No newline at end of file
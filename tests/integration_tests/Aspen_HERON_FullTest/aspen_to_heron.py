@@ -67,9 +67,6 @@ if __name__ == "__main__":
 
 
   output_file = parnet_folder_name+"/new_"+filename
-  file_exists = os.path.exists(output_file)
-  if file_exists:
-    os.remove(output_file)
 
   with open(output_file, "w", encoding="utf8") as out:
     print((xm.prettify(new_HERON_tree )), file=out)